@@ -1,12 +1,62 @@
-import streamlit as st
-import pandas as pd
 import re
 import json
 import time
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 import hashlib
+import hmac
 import os
+import bisect
+import importlib
+import atexit
+import threading
+import csv
+import io
+import pickle
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+class _LazyModule:
+    """Proxy modul yang baru di-import ketika atributnya pertama kali diakses"""
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+# Streamlit, pandas, dan pyarrow cukup berat untuk di-import; kelas data,
+# validasi, dan algoritma bisa dipakai tanpa membayar biaya import ketiganya
+st = _LazyModule("streamlit")
+pd = _LazyModule("pandas")
+pa = _LazyModule("pyarrow")  # sudah terpasang sebagai dependensi streamlit
+
+try:
+    import orjson  # Opsional: serialisasi JSON lebih cepat
+except ImportError:
+    orjson = None
+
+# Pola regex validasi dikompilasi sekali saat modul dimuat;
+# dipakai dengan fullmatch agar newline di akhir input tidak lolos
+_NAMA_RE = re.compile(r'[A-Za-z\s\.]{3,50}')
+_USERNAME_RE = re.compile(r'[a-zA-Z0-9_]{3,20}')
+
+def _json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialisasi ke JSON UTF-8 (ber-indent atau satu baris), memakai orjson bila tersedia"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _json_loads(raw: bytes) -> Any:
+    """Parsing JSON, memakai orjson bila tersedia"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 # ============================================
 # KELAS DASAR DAN INHERITANCE
@@ -14,8 +64,11 @@ import os
 
 class Person:
     """Kelas dasar untuk merepresentasikan seseorang"""
+    __slots__ = ('_nama', '_nama_lower')  # Tanpa __dict__ per objek
+    
     def __init__(self, nama: str):
         self._nama = nama
+        self._nama_lower = nama.lower()  # Cache untuk pencarian/pengurutan
     
     @property
     def nama(self) -> str:
@@ -26,6 +79,11 @@ class Person:
         if not value.strip():
             raise ValueError("Nama tidak boleh kosong")
         self._nama = value
+        self._nama_lower = value.lower()
+    
+    @property
+    def nama_lower(self) -> str:
+        return self._nama_lower
     
     def get_info(self) -> str:
         """Polimorfisme: Method yang akan di-override oleh subclass"""
@@ -33,6 +91,7 @@ class Person:
 
 class Mahasiswa(Person):
     """Kelas Mahasiswa yang mewarisi dari Person"""
+    __slots__ = ('_nim', '_id')
     _total_mahasiswa = 0  # Class variable
     
     def __init__(self, nama: str, nim: str):
@@ -47,7 +106,7 @@ class Mahasiswa(Person):
     
     @nim.setter
     def nim(self, value: str):
-        if not re.match(r'^\d+$', value):
+        if not value.isdecimal():
             raise ValueError("NIM harus berupa angka")
         self._nim = value
     
@@ -69,16 +128,23 @@ class Mahasiswa(Person):
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Mahasiswa':
-        """Membuat objek Mahasiswa dari dictionary"""
-        mhs = cls(data['nama'], data['nim'])
+        """
+        Membuat objek Mahasiswa dari dictionary tanpa lewat __init__. Counter
+        _total_mahasiswa tidak ditambah per objek, tetapi dinaikkan minimal ke
+        ID data ini agar Mahasiswa baru tidak mendapat ID yang sudah terpakai.
+        """
+        mhs = cls.__new__(cls)
+        Person.__init__(mhs, data['nama'])
+        mhs._nim = data['nim']
         mhs._id = data['id']
+        if mhs._id > cls._total_mahasiswa:
+            cls._total_mahasiswa = mhs._id
         return mhs
     
     @staticmethod
     def validate_nim(nim: str) -> bool:
-        """Validasi format NIM menggunakan regex"""
-        pattern = r'^\d{9,12}$'
-        return bool(re.match(pattern, nim))
+        """Validasi format NIM: 9-12 digit angka"""
+        return 9 <= len(nim) <= 12 and nim.isdecimal()
     
     @classmethod
     def get_total_mahasiswa(cls) -> int:
@@ -91,10 +157,42 @@ class Mahasiswa(Person):
 class DataManager:
     """Kelas untuk mengelola data mahasiswa menggunakan array/pointer"""
     
-    def __init__(self):
+    def __init__(self, file_path: str = "data_mahasiswa.json"):
         self._data: List[Mahasiswa] = []  # Array untuk menyimpan data
         self._current_index = 0  # Pointer untuk iterasi
-        self._file_path = "data_mahasiswa.json"
+        self._file_path = file_path
+        # Log operasi append-only; digabung ke file JSON saat compaction
+        self._log_path = os.path.splitext(file_path)[0] + ".log"
+        # Indeks NIM: dict untuk akses O(1), list terurut untuk binary search.
+        # Kolom NIM terurut disimpan terpisah (paralel dengan list objeknya)
+        # agar bisect membandingkan string langsung tanpa akses atribut
+        self._by_nim: Dict[str, Mahasiswa] = {}
+        self._sorted_by_nim: List[Mahasiswa] = []
+        self._sorted_nims: List[str] = []
+        # Snapshot read-only kolom terurut untuk get_sorted_columns(), dibuang
+        # setiap kali data berubah
+        self._sorted_snapshot: Optional[tuple[tuple[Mahasiswa, ...], tuple[str, ...]]] = None
+        # Snapshot read-only untuk get_all(), dibuang setiap kali data berubah
+        self._snapshot: Optional[tuple[Mahasiswa, ...]] = None
+        # Kolom NIM dan nama (SoA) untuk tampilan, dibuat saat dibutuhkan
+        self._columns: Optional[tuple[List[str], List[str]]] = None
+        # Nomor versi data, naik setiap kali data berubah (kunci cache tampilan)
+        self._version = 0
+        # Status penyimpanan: _dirty berarti log berisi operasi yang belum
+        # digabung ke file JSON; ukuran dipakai untuk memicu compaction
+        self._dirty = False
+        self._file_size = 0
+        self._log_size = 0
+        # Satu DataManager dipakai bersama oleh semua sesi (thread) Streamlit;
+        # lock menjaga perubahan data dan cache turunannya tetap konsisten
+        self._lock = threading.RLock()
+        # Stempel waktu file JSON + log setelah tulis/baca terakhir oleh objek ini,
+        # untuk mendeteksi perubahan dari luar (proses lain atau edit manual)
+        self._stamp = (0, 0)
+        # ID berikutnya untuk mahasiswa baru. Dikelola DataManager, bukan
+        # counter kelas Mahasiswa: setiap sesi Streamlit menjalankan modul
+        # baru dengan kelas (dan counter) sendiri, sedangkan data dipakai bersama
+        self._next_id = 1
     
     def _get_pointer(self) -> int:
         """Mendapatkan pointer saat ini"""
@@ -105,11 +203,81 @@ class DataManager:
         if 0 <= index < len(self._data):
             self._current_index = index
     
+    def _index_tambah(self, mahasiswa: Mahasiswa):
+        """Memasukkan mahasiswa ke indeks NIM"""
+        self._sorted_snapshot = None
+        self._snapshot = None
+        self._columns = None
+        self._version += 1
+        self._by_nim[mahasiswa._nim] = mahasiswa
+        pos = bisect.bisect_right(self._sorted_nims, mahasiswa._nim)
+        self._sorted_nims.insert(pos, mahasiswa._nim)
+        self._sorted_by_nim.insert(pos, mahasiswa)
+    
+    def _index_hapus(self, mahasiswa: Mahasiswa):
+        """Mengeluarkan mahasiswa dari indeks NIM"""
+        self._sorted_snapshot = None
+        self._snapshot = None
+        self._columns = None
+        self._version += 1
+        if self._by_nim.get(mahasiswa._nim) is mahasiswa:
+            del self._by_nim[mahasiswa._nim]
+        pos = bisect.bisect_left(self._sorted_nims, mahasiswa._nim)
+        while self._sorted_by_nim[pos] is not mahasiswa:
+            pos += 1
+        del self._sorted_nims[pos]
+        del self._sorted_by_nim[pos]
+    
+    def _bangun_index(self):
+        """Membangun ulang indeks NIM dari array data"""
+        self._sorted_snapshot = None
+        self._snapshot = None
+        self._columns = None
+        self._version += 1
+        self._by_nim = {mhs._nim: mhs for mhs in self._data}
+        self._sorted_by_nim = sorted(self._data, key=lambda x: x._nim)
+        self._sorted_nims = [mhs._nim for mhs in self._sorted_by_nim]
+    
     def tambah(self, mahasiswa: Mahasiswa):
-        """Menambahkan mahasiswa ke array"""
-        self._data.append(mahasiswa)
-        # Auto-save setelah tambah
-        self.simpan_ke_file()
+        """Menambahkan mahasiswa ke array (NIM harus unik, ID diberikan oleh DataManager)"""
+        with self._lock:
+            if mahasiswa.nim in self._by_nim:
+                raise ValueError(f"NIM {mahasiswa.nim} sudah terdaftar")
+            mahasiswa._id = self._next_id
+            self._next_id += 1
+            self._data.append(mahasiswa)
+            self._index_tambah(mahasiswa)
+            # Auto-save setelah tambah
+            self._catat({'op': 'add', 'd': mahasiswa.to_dict()})
+    
+    def tambah_batch(self, mahasiswa_list: List[Mahasiswa]):
+        """
+        Menambahkan banyak mahasiswa sekaligus dengan satu kali tulis ke file.
+        Setiap mahasiswa mendapat ID baru dari DataManager; ID bawaan (mis. dari
+        file impor) diabaikan karena bisa bentrok dengan ID yang sudah ada.
+        """
+        with self._lock:
+            nims = set()
+            for mhs in mahasiswa_list:
+                if mhs.nim in self._by_nim or mhs.nim in nims:
+                    raise ValueError(f"NIM {mhs.nim} sudah terdaftar")
+                nims.add(mhs.nim)
+            
+            if mahasiswa_list:
+                for mhs in mahasiswa_list:
+                    mhs._id = self._next_id
+                    self._next_id += 1
+                self._data.extend(mahasiswa_list)
+                self._bangun_index()
+                self._catat(*({'op': 'add', 'd': mhs.to_dict()} for mhs in mahasiswa_list))
+    
+    def clear(self):
+        """Menghapus semua data sekaligus, bukan hapus(0) berulang yang O(n²)"""
+        with self._lock:
+            self._data = []
+            self._bangun_index()
+            # File JSON langsung ditulis ulang (kosong) dan log dibuang
+            self.simpan_ke_file()
     
     def get_by_index(self, index: int) -> Optional[Mahasiswa]:
         """Mengakses data menggunakan pointer/indeks"""
@@ -118,50 +286,244 @@ class DataManager:
         except IndexError:
             return None
     
-    def get_all(self) -> List[Mahasiswa]:
-        """Mengembalikan semua data"""
-        return self._data.copy()
+    def get_all(self) -> tuple[Mahasiswa, ...]:
+        """Mengembalikan semua data sebagai snapshot read-only"""
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = tuple(self._data)
+            return self._snapshot
+    
+    def get_columns(self) -> tuple[List[str], List[str]]:
+        """Mengembalikan kolom NIM dan kolom nama (read-only), di-cache sampai data berubah"""
+        with self._lock:
+            if self._columns is None:
+                self._columns = ([mhs._nim for mhs in self._data], [mhs._nama for mhs in self._data])
+            return self._columns
+    
+    def get_sorted_columns(self) -> tuple[tuple[Mahasiswa, ...], tuple[str, ...]]:
+        """
+        Mengembalikan data terurut berdasarkan NIM beserta kolom NIM paralelnya
+        (untuk binary search), sebagai snapshot read-only yang di-cache sampai
+        data berubah. Keduanya diambil bersamaan agar selalu sepasang.
+        """
+        with self._lock:
+            if self._sorted_snapshot is None:
+                self._sorted_snapshot = (tuple(self._sorted_by_nim), tuple(self._sorted_nims))
+            return self._sorted_snapshot
+    
+    def find_by_nim(self, nim: str) -> Optional[Mahasiswa]:
+        """Mencari mahasiswa berdasarkan NIM persis: O(1)"""
+        return self._by_nim.get(nim)
+    
+    def get_version(self) -> int:
+        """Mendapatkan nomor versi data saat ini"""
+        return self._version
     
     def get_count(self) -> int:
         """Mendapatkan jumlah data"""
         return len(self._data)
     
     def edit(self, index: int, nama: str, nim: str):
-        """Mengedit data mahasiswa"""
-        if 0 <= index < len(self._data):
-            self._data[index].nama = nama
-            self._data[index].nim = nim
-            # Auto-save setelah edit
-            self.simpan_ke_file()
+        """Mengedit data mahasiswa (NIM baru tidak boleh milik mahasiswa lain)"""
+        with self._lock:
+            if 0 <= index < len(self._data):
+                mhs = self._data[index]
+                nim_lama = mhs.nim
+                pemilik = self._by_nim.get(nim)
+                if pemilik is not None and pemilik is not mhs:
+                    raise ValueError(f"NIM {nim} sudah digunakan oleh mahasiswa lain")
+                self._index_hapus(mhs)
+                try:
+                    mhs.nama = nama
+                    mhs.nim = nim
+                finally:
+                    self._index_tambah(mhs)
+                # Auto-save setelah edit
+                self._catat({'op': 'edit', 'nim': nim_lama, 'd': mhs.to_dict()})
+    
+    def edit_by_nim(self, nim_lama: str, nama: str, nim: str):
+        """
+        Mengedit data berdasarkan NIM lamanya. Berbeda dengan indeks, NIM
+        tetap menunjuk mahasiswa yang sama walau sesi lain mengubah urutan data.
+        """
+        with self._lock:
+            mhs = self._by_nim.get(nim_lama)
+            if mhs is None:
+                raise ValueError(f"NIM {nim_lama} tidak ditemukan")
+            self.edit(self._data.index(mhs), nama, nim)
     
     def hapus(self, index: int):
         """Menghapus data mahasiswa"""
-        if 0 <= index < len(self._data):
-            del self._data[index]
+        with self._lock:
+            if 0 <= index < len(self._data):
+                mhs = self._data.pop(index)
+                self._index_hapus(mhs)
+                # Auto-save setelah hapus
+                self._catat({'op': 'del', 'nim': mhs.nim})
+    
+    def hapus_batch(self, indices: List[int]):
+        """Menghapus banyak data sekaligus dalam satu pass, bukan k kali hapus() yang O(k·n)"""
+        with self._lock:
+            buang = {i for i in indices if 0 <= i < len(self._data)}
+            if not buang:
+                return
+            
+            removed = [self._data[i] for i in sorted(buang)]
+            self._data = [mhs for i, mhs in enumerate(self._data) if i not in buang]
+            self._bangun_index()
             # Auto-save setelah hapus
-            self.simpan_ke_file()
+            self._catat(*({'op': 'del', 'nim': mhs._nim} for mhs in removed))
     
-    def simpan_ke_file(self):
-        """Menyimpan data ke file JSON"""
+    def hapus_by_nim(self, nims: List[str]) -> int:
+        """Menghapus data berdasarkan daftar NIM dalam satu pass; mengembalikan jumlah yang terhapus"""
+        with self._lock:
+            buang = set(nims)
+            indices = [i for i, mhs in enumerate(self._data) if mhs._nim in buang]
+            self.hapus_batch(indices)
+            return len(indices)
+    
+    def _catat(self, *entries: Dict[str, Any]):
+        """
+        Menambahkan operasi ke log dalam satu kali tulis: O(1) per perubahan.
+        Log dipadatkan ke file JSON jika sudah lebih dari 2x ukuran file tersebut.
+        """
         try:
-            data_to_save = [mhs.to_dict() for mhs in self._data]
-            with open(self._file_path, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, indent=2, ensure_ascii=False)
-            return True
+            lines = b''.join(_json_dumps(entry, indent=False) + b'\n' for entry in entries)
+            with open(self._log_path, 'ab') as f:
+                f.write(lines)
         except Exception as e:
             raise Exception(f"Gagal menyimpan ke file: {str(e)}")
+        
+        self._dirty = True
+        self._log_size += len(lines)
+        self._stamp = self.get_file_stamp()
+        if self._log_size > 2 * self._file_size:
+            self.simpan_ke_file()
+    
+    def flush(self):
+        """Memaksa penggabungan log yang belum tertulis ke file JSON"""
+        with self._lock:
+            if self._dirty:
+                self.simpan_ke_file()
+    
+    def simpan_ke_file(self):
+        """
+        Compaction: menulis seluruh data ke file JSON secara atomik
+        (tulis ke file sementara lalu rename), kemudian mengosongkan log
+        """
+        with self._lock:
+            try:
+                data_to_save = _json_dumps([mhs.to_dict() for mhs in self._data])
+                tmp_path = self._file_path + ".tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data_to_save)
+                os.replace(tmp_path, self._file_path)
+                # Jika proses berhenti sebelum log dikosongkan, replay saat baca
+                # bersifat idempoten sehingga data tetap konsisten
+                if os.path.exists(self._log_path):
+                    os.remove(self._log_path)
+                self._dirty = False
+                self._file_size = len(data_to_save)
+                self._log_size = 0
+                self._stamp = self.get_file_stamp()
+                return True
+            except Exception as e:
+                raise Exception(f"Gagal menyimpan ke file: {str(e)}")
+    
+    @staticmethod
+    def _replay_log(records: List[Dict[str, Any]], lines: List[bytes]) -> List[Dict[str, Any]]:
+        """Menerapkan operasi log ke data dari file JSON (add/edit sebagai upsert per NIM)"""
+        pos = {item['nim']: i for i, item in enumerate(records)}
+        
+        for raw in lines:
+            if not raw.strip():
+                continue
+            try:
+                entry = _json_loads(raw)
+            except ValueError:
+                continue  # Baris terpotong karena proses berhenti saat menulis
+            
+            nim_lama = entry.get('nim')
+            item = entry.get('d')
+            i = pos.pop(nim_lama, None) if nim_lama is not None else None
+            
+            if item is None:  # del
+                if i is not None:
+                    records[i] = None
+                continue
+            
+            j = pos.pop(item['nim'], None)
+            if i is None:
+                i = j
+            elif j is not None:
+                records[j] = None
+            
+            if i is None:
+                i = len(records)
+                records.append(item)
+            else:
+                records[i] = item
+            pos[item['nim']] = i
+        
+        return [item for item in records if item is not None]
+    
+    def get_file_stamp(self) -> tuple[int, int]:
+        """Waktu modifikasi (ns) file JSON dan file log, 0 jika file belum ada"""
+        stamp = []
+        for path in (self._file_path, self._log_path):
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except FileNotFoundError:
+                stamp.append(0)
+        return stamp[0], stamp[1]
     
     def baca_dari_file(self):
-        """Membaca data dari file JSON"""
-        try:
-            if os.path.exists(self._file_path):
-                with open(self._file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                self._data = [Mahasiswa.from_dict(item) for item in data]
-                Mahasiswa._total_mahasiswa = max([mhs.id for mhs in self._data], default=0)
+        """Membaca data dari file JSON lalu menerapkan log operasi di atasnya"""
+        with self._lock:
+            try:
+                data = []
+                if os.path.exists(self._file_path):
+                    with open(self._file_path, 'rb') as f:
+                        data = _json_loads(f.read())
+                if os.path.exists(self._log_path):
+                    with open(self._log_path, 'rb') as f:
+                        data = self._replay_log(data, f.read().splitlines())
+                
+                self._file_size = os.path.getsize(self._file_path) if os.path.exists(self._file_path) else 0
+                self._log_size = os.path.getsize(self._log_path) if os.path.exists(self._log_path) else 0
+                
+                if self._file_size or self._log_size:
+                    # Satu pass: bangun objek sekaligus mencari ID terbesar
+                    max_id = 0
+                    self._data = []
+                    for item in data:
+                        mhs = Mahasiswa.from_dict(item)
+                        self._data.append(mhs)
+                        if mhs._id > max_id:
+                            max_id = mhs._id
+                    self._next_id = max_id + 1
+                    self._bangun_index()
+                
+                # Sisa log dari sesi sebelumnya langsung dipadatkan, sehingga
+                # baris terpotong tidak tersambung dengan operasi berikutnya
+                if self._log_size:
+                    self.simpan_ke_file()
+                self._stamp = self.get_file_stamp()
+                return True
+            except Exception as e:
+                raise Exception(f"Gagal membaca file: {str(e)}")
+    
+    def sinkronkan(self) -> bool:
+        """
+        Membaca ulang file JSON + log jika berubah di luar DataManager ini
+        (proses lain atau edit manual) sejak tulis/baca terakhirnya.
+        Mengembalikan True jika data dibaca ulang.
+        """
+        with self._lock:
+            if self.get_file_stamp() == self._stamp:
+                return False
+            self.baca_dari_file()
             return True
-        except Exception as e:
-            raise Exception(f"Gagal membaca file: {str(e)}")
 
 # ============================================
 # ALGORITMA PENCARIAN
@@ -176,34 +538,39 @@ class SearchAlgorithms:
         Linear Search: O(n)
         Mencari data secara berurutan
         """
-        results = []
         keyword_lower = keyword.lower()
         
-        for mhs in data:
-            value = mhs.nama.lower() if by == 'nama' else mhs.nim
-            if keyword_lower in value.lower():
-                results.append(mhs)
-        
-        return results
+        # Percabangan kolom dilakukan sekali di luar loop
+        if by == 'nama':
+            return [mhs for mhs in data if keyword_lower in mhs._nama_lower]
+        return [mhs for mhs in data if keyword_lower in mhs._nim]
     
     @staticmethod
-    def binary_search(data: List[Mahasiswa], nim: str) -> Optional[Mahasiswa]:
+    def binary_search(data: List[Mahasiswa], nim: str,
+                      nims: Optional[List[str]] = None) -> Optional[Mahasiswa]:
         """
         Binary Search: O(log n)
-        Hanya bekerja pada data yang sudah terurut berdasarkan NIM
+        Jika `nims` diberikan, `data` harus sudah terurut berdasarkan NIM dan
+        `nims` kolom NIM paralelnya (lihat DataManager.get_sorted_columns);
+        perbandingan dilakukan langsung di kolom itu. Tanpa `nims`, data
+        diurutkan dulu (O(n log n)) sehingga input tak terurut tetap aman.
         """
-        # Pastikan data terurut
-        sorted_data = sorted(data, key=lambda x: x.nim)
+        # Untuk data kecil, linear scan lebih murah daripada bisection
+        if len(data) < 32:
+            return next((mhs for mhs in data if mhs._nim == nim), None)
+        
+        if nims is None:
+            data = sorted(data, key=lambda x: x._nim)
         
         low = 0
-        high = len(sorted_data) - 1
+        high = len(data) - 1
         
         while low <= high:
             mid = (low + high) // 2
-            mid_nim = sorted_data[mid].nim
+            mid_nim = nims[mid] if nims is not None else data[mid]._nim
             
             if mid_nim == nim:
-                return sorted_data[mid]
+                return data[mid]
             elif mid_nim < nim:
                 low = mid + 1
             else:
@@ -226,21 +593,49 @@ class SearchAlgorithms:
 class SortAlgorithms:
     """Kelas yang mengimplementasikan berbagai algoritma pengurutan"""
     
+    @staticmethod
+    def _key_func(by: str):
+        """Fungsi kunci pengurutan berdasarkan nama atau NIM"""
+        if by == 'nama':
+            return lambda m: m._nama_lower
+        return lambda m: m._nim
+    
+    @staticmethod
+    def _rank_keys(keys: List[str]) -> List[int]:
+        """
+        Mengganti kunci string dengan peringkat integer yang urutannya sama,
+        sehingga loop perbandingan cukup membandingkan int kecil
+        """
+        rank = {key: i for i, key in enumerate(sorted(set(keys)))}
+        return [rank[key] for key in keys]
+    
+    @staticmethod
+    def _sort_keys(data: List[Mahasiswa], by: str) -> List[int]:
+        """Kunci integer untuk setiap elemen data, dihitung sekali per pengurutan"""
+        return SortAlgorithms._rank_keys(list(map(SortAlgorithms._key_func(by), data)))
+    
+    @staticmethod
+    def builtin_sort(data: List[Mahasiswa], by: str = 'nama') -> List[Mahasiswa]:
+        """
+        Timsort bawaan Python: O(n log n)
+        Dijalankan di C, sebagai pembanding algoritma lainnya
+        """
+        return sorted(data, key=SortAlgorithms._key_func(by))
+    
     @staticmethod
     def bubble_sort(data: List[Mahasiswa], by: str = 'nama') -> List[Mahasiswa]:
         """
         Bubble Sort: O(n²)
         Pengurutan dengan metode pertukaran
         """
-        sorted_data = data.copy()
+        sorted_data = list(data)
+        keys = SortAlgorithms._sort_keys(sorted_data, by)
         n = len(sorted_data)
         
         for i in range(n):
             for j in range(0, n - i - 1):
-                a = sorted_data[j].nama.lower() if by == 'nama' else sorted_data[j].nim
-                b = sorted_data[j + 1].nama.lower() if by == 'nama' else sorted_data[j + 1].nim
-                
-                if a > b:
+                if keys[j] > keys[j + 1]:
+                    keys[j], keys[j + 1] = keys[j + 1], keys[j]
                     sorted_data[j], sorted_data[j + 1] = sorted_data[j + 1], sorted_data[j]
         
         return sorted_data
@@ -251,18 +646,17 @@ class SortAlgorithms:
         Selection Sort: O(n²)
         Pengurutan dengan memilih elemen terkecil
         """
-        sorted_data = data.copy()
+        sorted_data = list(data)
+        keys = SortAlgorithms._sort_keys(sorted_data, by)
         n = len(sorted_data)
         
         for i in range(n):
             min_idx = i
             for j in range(i + 1, n):
-                a = sorted_data[min_idx].nama.lower() if by == 'nama' else sorted_data[min_idx].nim
-                b = sorted_data[j].nama.lower() if by == 'nama' else sorted_data[j].nim
-                
-                if a > b:
+                if keys[min_idx] > keys[j]:
                     min_idx = j
             
+            keys[i], keys[min_idx] = keys[min_idx], keys[i]
             sorted_data[i], sorted_data[min_idx] = sorted_data[min_idx], sorted_data[i]
         
         return sorted_data
@@ -271,25 +665,21 @@ class SortAlgorithms:
     def insertion_sort(data: List[Mahasiswa], by: str = 'nama') -> List[Mahasiswa]:
         """
         Insertion Sort: O(n²)
-        Pengurutan seperti mengurutkan kartu
+        Pengurutan seperti mengurutkan kartu (binary insertion:
+        perbandingan O(n log n), pergeseran tetap O(n²))
         """
-        sorted_data = data.copy()
+        sorted_data = list(data)
+        keys = SortAlgorithms._sort_keys(sorted_data, by)
         
         for i in range(1, len(sorted_data)):
-            key = sorted_data[i]
-            j = i - 1
+            # Posisi sisip dicari dengan binary search pada prefix yang sudah terurut
+            # (bisect_right menjaga kestabilan untuk kunci yang sama)
+            pos = bisect.bisect_right(keys, keys[i], 0, i)
             
-            while j >= 0:
-                a = sorted_data[j].nama.lower() if by == 'nama' else sorted_data[j].nim
-                b = key.nama.lower() if by == 'nama' else key.nim
-                
-                if a > b:
-                    sorted_data[j + 1] = sorted_data[j]
-                    j -= 1
-                else:
-                    break
-            
-            sorted_data[j + 1] = key
+            if pos < i:
+                # Geser blok [pos:i] sekaligus lewat pop/insert (memmove di C)
+                keys.insert(pos, keys.pop(i))
+                sorted_data.insert(pos, sorted_data.pop(i))
         
         return sorted_data
     
@@ -297,28 +687,73 @@ class SortAlgorithms:
     def merge_sort(data: List[Mahasiswa], by: str = 'nama') -> List[Mahasiswa]:
         """
         Merge Sort: O(n log n)
-        Pengurutan dengan metode divide and conquer
+        Versi bottom-up iteratif: run berukuran 1, 2, 4, ... digabung
+        bolak-balik antara dua buffer tanpa membuat slice baru
+        """
+        items = list(data)
+        keys = list(map(SortAlgorithms._key_func(by), items))
+        n = len(items)
+        buf_items = [None] * n
+        buf_keys = [None] * n
+        width = 1
+        
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                SortAlgorithms._merge_runs(keys, items, buf_keys, buf_items, lo, mid, hi)
+            keys, buf_keys = buf_keys, keys
+            items, buf_items = buf_items, items
+            width *= 2
+        
+        return items
+    
+    @staticmethod
+    def _merge_runs(src_keys: list, src_items: list, dst_keys: list, dst_items: list,
+                    lo: int, mid: int, hi: int):
+        """Menggabungkan run src[lo:mid] dan src[mid:hi] ke dst[lo:hi]"""
+        i, j = lo, mid
+        
+        for k in range(lo, hi):
+            if i < mid and (j >= hi or src_keys[i] <= src_keys[j]):
+                dst_keys[k] = src_keys[i]
+                dst_items[k] = src_items[i]
+                i += 1
+            else:
+                dst_keys[k] = src_keys[j]
+                dst_items[k] = src_items[j]
+                j += 1
+    
+    @staticmethod
+    def merge_sort_educational(data: List[Mahasiswa], by: str = 'nama') -> List[Mahasiswa]:
+        """
+        Merge Sort rekursif: O(n log n)
+        Pengurutan dengan metode divide and conquer (versi klasik top-down)
         """
-        if len(data) <= 1:
-            return data
+        keys = list(map(SortAlgorithms._key_func(by), data))
+        indices = SortAlgorithms._merge_sort_indices(list(range(len(data))), keys)
+        return [data[i] for i in indices]
+    
+    @staticmethod
+    def _merge_sort_indices(indices: List[int], keys: List[str]) -> List[int]:
+        """Merge sort rekursif atas indeks, membandingkan kunci yang sudah dihitung"""
+        if len(indices) <= 1:
+            return indices
         
-        mid = len(data) // 2
-        left = SortAlgorithms.merge_sort(data[:mid], by)
-        right = SortAlgorithms.merge_sort(data[mid:], by)
+        mid = len(indices) // 2
+        left = SortAlgorithms._merge_sort_indices(indices[:mid], keys)
+        right = SortAlgorithms._merge_sort_indices(indices[mid:], keys)
         
-        return SortAlgorithms._merge(left, right, by)
+        return SortAlgorithms._merge(left, right, keys)
     
     @staticmethod
-    def _merge(left: List[Mahasiswa], right: List[Mahasiswa], by: str) -> List[Mahasiswa]:
+    def _merge(left: List[int], right: List[int], keys: List[str]) -> List[int]:
         """Helper function untuk merge sort"""
         result = []
         i = j = 0
         
         while i < len(left) and j < len(right):
-            a = left[i].nama.lower() if by == 'nama' else left[i].nim
-            b = right[j].nama.lower() if by == 'nama' else right[j].nim
-            
-            if a <= b:
+            if keys[left[i]] <= keys[right[j]]:
                 result.append(left[i])
                 i += 1
             else:
@@ -335,26 +770,26 @@ class SortAlgorithms:
         Shell Sort: O(n log n) sampai O(n²)
         Pengurutan dengan gap sequence
         """
-        sorted_data = data.copy()
+        sorted_data = list(data)
+        keys = SortAlgorithms._sort_keys(sorted_data, by)
         n = len(sorted_data)
         gap = n // 2
         
         while gap > 0:
             for i in range(gap, n):
-                temp = sorted_data[i]
+                temp_key = keys[i]
                 j = i
                 
-                while j >= gap:
-                    a = sorted_data[j - gap].nama.lower() if by == 'nama' else sorted_data[j - gap].nim
-                    b = temp.nama.lower() if by == 'nama' else temp.nim
-                    
-                    if a > b:
-                        sorted_data[j] = sorted_data[j - gap]
-                        j -= gap
-                    else:
-                        break
+                # Cari dulu posisi sisip, baru geser semua elemen dalam satu slice assignment
+                while j >= gap and keys[j - gap] > temp_key:
+                    j -= gap
                 
-                sorted_data[j] = temp
+                if j < i:
+                    temp = sorted_data[i]
+                    sorted_data[j + gap:i + 1:gap] = sorted_data[j:i:gap]
+                    keys[j + gap:i + 1:gap] = keys[j:i:gap]
+                    sorted_data[j] = temp
+                    keys[j] = temp_key
             gap //= 2
         
         return sorted_data
@@ -369,24 +804,21 @@ class Validator:
     @staticmethod
     def validate_nama(nama: str) -> tuple[bool, str]:
         """Validasi nama menggunakan regex"""
-        pattern = r'^[A-Za-z\s\.]{3,50}$'
-        if re.match(pattern, nama):
+        if _NAMA_RE.fullmatch(nama):
             return True, ""
         return False, "Nama harus 3-50 karakter, hanya boleh huruf dan spasi"
     
     @staticmethod
     def validate_nim(nim: str) -> tuple[bool, str]:
-        """Validasi NIM menggunakan regex"""
-        pattern = r'^\d{9,12}$'
-        if re.match(pattern, nim):
+        """Validasi NIM: 9-12 digit angka"""
+        if 9 <= len(nim) <= 12 and nim.isdecimal():
             return True, ""
         return False, "NIM harus 9-12 digit angka"
     
     @staticmethod
     def validate_username(username: str) -> bool:
         """Validasi username untuk login"""
-        pattern = r'^[a-zA-Z0-9_]{3,20}$'
-        return bool(re.match(pattern, username))
+        return bool(_USERNAME_RE.fullmatch(username))
     
     @staticmethod
     def validate_password(password: str) -> bool:
@@ -399,21 +831,39 @@ class Validator:
 # SISTEM AUTHENTIKASI (PERBAIKAN PASSWORD)
 # ============================================
 
+# Pasangan (salt, hash scrypt) dihitung sekali di luar aplikasi,
+# sehingga membuat AuthSystem baru tidak perlu menjalankan KDF
+_ADMIN_HASH = (
+    bytes.fromhex('e015b15ed260c8eb7fa1cd8954ce283f'),
+    bytes.fromhex('c1e8705388bb330c052ca9b703b9e331614138b80b6a80f28f53e5c32d132d6f'),
+)
+_OP_HASH = (
+    bytes.fromhex('00d1646f7ebbb85e3123d7e7b59ec9c7'),
+    bytes.fromhex('7d1bf03ade9e340235339eec40c7d703fdc4af97ac627c87b404a3b1e5c8a41b'),
+)
+# Pasangan acak (bukan hash password apa pun) untuk username yang tidak
+# terdaftar, agar KDF tetap dijalankan dan waktu login tidak membocorkan
+# username mana yang valid
+_DUMMY_HASH = (
+    bytes.fromhex('bafb8a224a428653b112ef70637f2032'),
+    bytes.fromhex('bed1f06030e7847220d10627b083ecc5e572d7240a4e1703a36762f7847fab45'),
+)
+
 class AuthSystem:
     """Kelas untuk mengelola login/logout"""
     
     def __init__(self):
         # Perbaikan: Sesuaikan dengan credential di deskripsi
         self._users = {
-            'admin': self._hash_password('admin123'),
-            'operator': self._hash_password('opt23')  # Diubah dari 'op123' ke 'opt23'
+            'admin': _ADMIN_HASH,      # admin123
+            'operator': _OP_HASH       # opt23 (diubah dari 'op123')
         }
         self.logged_in_user = None
     
     @staticmethod
-    def _hash_password(password: str) -> str:
-        """Hash password menggunakan SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def _hash_password(password: str, salt: bytes) -> bytes:
+        """Hash password menggunakan KDF scrypt"""
+        return hashlib.scrypt(password.encode(), salt=salt, n=16384, r=8, p=1, dklen=32)
     
     def login(self, username: str, password: str) -> bool:
         """Proses login"""
@@ -421,9 +871,13 @@ class AuthSystem:
             if not Validator.validate_username(username):
                 return False
             
-            hashed_password = self._hash_password(password)
+            # Username tidak terdaftar tetap melewati KDF yang sama (hash dummy)
+            terdaftar = username in self._users
+            salt, stored_hash = self._users[username] if terdaftar else _DUMMY_HASH
+            hashed_password = self._hash_password(password, salt)
             
-            if username in self._users and self._users[username] == hashed_password:
+            # Perbandingan waktu-konstan untuk mencegah timing attack
+            if hmac.compare_digest(hashed_password, stored_hash) and terdaftar:
                 self.logged_in_user = username
                 return True
             return False
@@ -443,12 +897,55 @@ class AuthSystem:
 # APLIKASI UTAMA
 # ============================================
 
+def _buat_data_manager() -> DataManager:
+    """
+    Membuat DataManager yang dipakai bersama oleh semua sesi dalam satu proses.
+    Dibungkus st.cache_resource oleh aplikasi, sehingga setiap sesi membaca dan
+    menulis data yang sama, bukan salinan sendiri yang saling menimpa saat
+    compaction.
+    """
+    data_manager = DataManager()
+    data_manager.baca_dari_file()
+    # Perubahan sudah tercatat di log; sisa log digabung ke file JSON saat
+    # proses berhenti. Hanya satu hook per proses, karena fungsi ini di-cache
+    atexit.register(data_manager.flush)
+    return data_manager
+
+# Di bawah ukuran ini biaya start-up process pool lebih besar dari waktu sorting
+_BENCHMARK_PARALLEL_MIN = 2000
+
+def _timed_sort(job: tuple[str, str, List[Dict[str, Any]]]) -> tuple[str, float]:
+    """
+    Worker benchmark: menjalankan satu algoritma sorting dan mengukur waktunya.
+    Menerima (label, nama method SortAlgorithms, record dict) agar bisa
+    di-pickle ke process lain; hasilnya (label, waktu dalam ms).
+    """
+    name, func_name, records = job
+    data = [Mahasiswa.from_dict(item) for item in records]
+    func = getattr(SortAlgorithms, func_name)
+    start_time = time.perf_counter_ns()
+    func(data, 'nama')
+    return name, (time.perf_counter_ns() - start_time) / 1e6
+
+def _benchmark_worker():
+    """
+    Mengambil _timed_sort dari modul ini yang di-import lewat namanya sendiri.
+    Streamlit menjalankan skrip sebagai modul __main__ baru di setiap rerun,
+    sehingga fungsi milik run lain tidak bisa di-pickle; fungsi dari modul
+    yang di-import biasa bisa dirujuk dan di-import ulang oleh process worker.
+    """
+    nama_modul = os.path.splitext(os.path.basename(__file__))[0]
+    return importlib.import_module(nama_modul)._timed_sort
+
 class AplikasiManajemenMahasiswa:
     """Kelas utama aplikasi"""
     
     def __init__(self):
+        # Login per sesi, data bersama untuk semua sesi. Jika data gagal dibaca,
+        # error diteruskan ke main() agar aplikasi dicoba lagi pada rerun
+        # berikutnya, bukan berjalan dengan data kosong yang bisa menimpa file
         self.auth = AuthSystem()
-        self.data_manager = DataManager()
+        self.data_manager = st.cache_resource(show_spinner=False)(_buat_data_manager)()
         self.sort_algorithms = SortAlgorithms()
         self.search_algorithms = SearchAlgorithms()
         
@@ -459,12 +956,6 @@ class AplikasiManajemenMahasiswa:
             st.session_state.search_results = []
             st.session_state.sort_method = 'bubble'
             st.session_state.sort_by = 'nama'
-        
-        # Load data dari file
-        try:
-            self.data_manager.baca_dari_file()
-        except Exception as e:
-            st.error(f"Error loading data: {str(e)}")
     
     def run(self):
         """Menjalankan aplikasi"""
@@ -474,6 +965,12 @@ class AplikasiManajemenMahasiswa:
             layout="wide"
         )
         
+        # Baca ulang data hanya jika file diubah dari luar aplikasi ini
+        try:
+            self.data_manager.sinkronkan()
+        except Exception as e:
+            st.error(f"Error loading data: {str(e)}")
+        
         # Sidebar untuk navigasi
         with st.sidebar:
             st.title("🎓 Sistem Login")
@@ -507,6 +1004,7 @@ class AplikasiManajemenMahasiswa:
         """Menampilkan section logout"""
         st.success(f"👤 Login sebagai: **{self.auth.logged_in_user}**")
         if st.button("Logout", type="secondary"):
+            self.data_manager.flush()
             self.auth.logout()
             st.rerun()
     
@@ -640,16 +1138,12 @@ class AplikasiManajemenMahasiswa:
                         st.error(msg_nim)
                     else:
                         # Cek duplikasi NIM
-                        existing_nim = any(mhs.nim == nim for mhs in self.data_manager.get_all())
-                        if existing_nim:
+                        if self.data_manager.find_by_nim(nim) is not None:
                             st.error("NIM sudah terdaftar!")
                         else:
                             # Buat objek mahasiswa dan tambahkan
                             mhs = Mahasiswa(nama, nim)
-                            self.data_manager.tambah(mhs)
-                            
-                            # Simpan ke file
-                            self.data_manager.simpan_ke_file()
+                            self.data_manager.tambah(mhs)  # Tercatat otomatis di log
                             
                             st.success(f"Data {nama} berhasil ditambahkan!")
                             st.rerun()
@@ -672,13 +1166,18 @@ class AplikasiManajemenMahasiswa:
             st.info("Belum ada data untuk diedit")
             return
         
-        # Pilih data yang akan diedit
-        options = [f"{i+1}. {mhs.nim} - {mhs.nama}" for i, mhs in enumerate(data)]
-        selected = st.selectbox("Pilih data yang akan diedit:", options)
+        # Pilih data yang akan diedit. Opsi berupa NIM,
+        # bukan indeks, agar pilihan tetap menunjuk mahasiswa yang sama walau
+        # sesi lain menambah/menghapus data di antara dua rerun
+        nomor = {mhs.nim: i for i, mhs in enumerate(data)}
+        nim_terpilih = st.selectbox(
+            "Pilih data yang akan diedit:",
+            list(nomor),
+            format_func=lambda nim: f"{nomor[nim]+1}. {nim} - {data[nomor[nim]].nama}"
+        )
         
-        if selected:
-            index = options.index(selected)
-            mhs = data[index]
+        mhs = self.data_manager.find_by_nim(nim_terpilih) if nim_terpilih is not None else None
+        if mhs is not None:
             
             with st.form("edit_form"):
                 col1, col2 = st.columns(2)
@@ -703,15 +1202,11 @@ class AplikasiManajemenMahasiswa:
                             st.error(msg_nim)
                         else:
                             # Cek duplikasi NIM (kecuali untuk data yang sedang diedit)
-                            existing_nim = any(
-                                i != index and m.nim == new_nim 
-                                for i, m in enumerate(data)
-                            )
-                            if existing_nim:
+                            pemilik = self.data_manager.find_by_nim(new_nim)
+                            if pemilik is not None and pemilik is not mhs:
                                 st.error("NIM sudah digunakan oleh mahasiswa lain!")
                             else:
-                                self.data_manager.edit(index, new_nama, new_nim)
-                                self.data_manager.simpan_ke_file()
+                                self.data_manager.edit_by_nim(mhs.nim, new_nama, new_nim)
                                 st.success("Data berhasil diupdate!")
                                 st.rerun()
                     
@@ -741,18 +1236,23 @@ class AplikasiManajemenMahasiswa:
         with col4:
             if st.button("🔍 Cari", type="primary", use_container_width=True):
                 if keyword:
-                    start_time = time.time()
+                    # Snapshot di-cache DataManager, diambil di luar pengukuran waktu
+                    data = self.data_manager.get_all()
+                    sorted_data, sorted_nims = self.data_manager.get_sorted_columns()
+                    start_time = time.perf_counter_ns()
                     
                     try:
-                        data = self.data_manager.get_all()
-                        
+                        # Setiap pilihan menjalankan algoritma yang namanya dipakai;
+                        # binary search memakai kolom NIM terurut milik DataManager
                         if algorithm == "Linear Search":
                             results = self.search_algorithms.linear_search(
                                 data, keyword, 'nama' if search_by == "Nama" else 'nim'
                             )
                         elif algorithm == "Binary Search":
                             if search_by == "NIM":
-                                result = self.search_algorithms.binary_search(data, keyword)
+                                result = self.search_algorithms.binary_search(
+                                    sorted_data, keyword, sorted_nims
+                                )
                                 results = [result] if result else []
                             else:
                                 results = []
@@ -760,7 +1260,7 @@ class AplikasiManajemenMahasiswa:
                         else:  # Sequential Search
                             results = self.search_algorithms.sequential_search(data, keyword)
                         
-                        elapsed_time = (time.time() - start_time) * 1000
+                        elapsed_time = (time.perf_counter_ns() - start_time) / 1e6
                         
                         st.session_state.search_results = results
                         st.session_state.search_time = elapsed_time
@@ -779,11 +1279,8 @@ class AplikasiManajemenMahasiswa:
                 st.info(f"Algoritma: {st.session_state.search_algorithm} | "
                        f"Waktu: {st.session_state.search_time:.2f} ms")
                 
-                df = pd.DataFrame([
-                    {"No": i+1, "NIM": m.nim, "Nama": m.nama}
-                    for i, m in enumerate(results)
-                ])
-                st.dataframe(df, use_container_width=True, hide_index=True)
+                tabel = self._buat_tabel(*self._kolom(results))
+                st.dataframe(tabel, use_container_width=True, hide_index=True)
             else:
                 st.warning("Tidak ditemukan data yang sesuai")
     
@@ -806,7 +1303,7 @@ class AplikasiManajemenMahasiswa:
         if st.button("🔄 Urutkan Data", type="primary"):
             try:
                 data = self.data_manager.get_all()
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 
                 if algorithm == "Bubble Sort":
                     sorted_data = self.sort_algorithms.bubble_sort(data, sort_by.lower())
@@ -819,7 +1316,7 @@ class AplikasiManajemenMahasiswa:
                 else:  # Shell Sort
                     sorted_data = self.sort_algorithms.shell_sort(data, sort_by.lower())
                 
-                elapsed_time = (time.time() - start_time) * 1000
+                elapsed_time = (time.perf_counter_ns() - start_time) / 1e6
                 
                 st.session_state.sorted_data = sorted_data
                 st.session_state.sort_time = elapsed_time
@@ -833,11 +1330,8 @@ class AplikasiManajemenMahasiswa:
             st.subheader(f"📋 Data Terurut ({st.session_state.sort_algorithm})")
             st.info(f"Waktu eksekusi: {st.session_state.sort_time:.2f} ms")
             
-            df = pd.DataFrame([
-                {"No": i+1, "NIM": m.nim, "Nama": m.nama}
-                for i, m in enumerate(st.session_state.sorted_data)
-            ])
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            tabel = self._buat_tabel(*self._kolom(st.session_state.sorted_data))
+            st.dataframe(tabel, use_container_width=True, hide_index=True)
     
     def _show_delete(self):
         """Menampilkan fitur penghapusan data"""
@@ -849,39 +1343,24 @@ class AplikasiManajemenMahasiswa:
             st.info("Belum ada data untuk dihapus")
             return
         
-        # Tampilkan data dengan checkbox
+        # Pilih data lewat multiselect. Opsi berupa NIM, bukan indeks, agar yang
+        # terhapus tetap data yang dipilih walau sesi lain mengubah urutan data
         st.subheader("Pilih data yang akan dihapus:")
         
-        df = pd.DataFrame([
-            {"Pilih": False, "No": i+1, "NIM": m.nim, "Nama": m.nama}
-            for i, m in enumerate(data)
-        ])
-        
-        edited_df = st.data_editor(
-            df,
-            column_config={
-                "Pilih": st.column_config.CheckboxColumn(
-                    "Pilih",
-                    help="Pilih data untuk dihapus",
-                    default=False
-                )
-            },
-            hide_index=True,
-            use_container_width=True
+        nomor = {mhs.nim: i for i, mhs in enumerate(data)}
+        selected_nims = st.multiselect(
+            "Pilih data:",
+            list(nomor),
+            format_func=lambda nim: f"{nomor[nim]+1}. {nim} - {data[nomor[nim]].nama}",
+            help="Pilih data untuk dihapus"
         )
         
         if st.button("🗑️ Hapus Data Terpilih", type="primary"):
             try:
-                # Dapatkan indeks yang dipilih
-                selected_indices = edited_df[edited_df['Pilih']].index.tolist()
-                
-                if selected_indices:
-                    # Hapus dari belakang untuk menjaga indeks
-                    for idx in sorted(selected_indices, reverse=True):
-                        self.data_manager.hapus(idx)
+                if selected_nims:
+                    jumlah = self.data_manager.hapus_by_nim(selected_nims)
                     
-                    self.data_manager.simpan_ke_file()
-                    st.success(f"Berhasil menghapus {len(selected_indices)} data!")
+                    st.success(f"Berhasil menghapus {jumlah} data!")
                     st.rerun()
                 else:
                     st.warning("Pilih minimal satu data untuk dihapus")
@@ -900,10 +1379,8 @@ class AplikasiManajemenMahasiswa:
             
             if st.button("📥 Download sebagai JSON", use_container_width=True):
                 try:
-                    self.data_manager.simpan_ke_file()
-                    
-                    with open("data_mahasiswa.json", "r") as f:
-                        data = f.read()
+                    # Serialisasi langsung dari memori, tanpa tulis-baca file
+                    data = _json_dumps([m.to_dict() for m in self.data_manager.get_all()])
                     
                     st.download_button(
                         label="Klik untuk download",
@@ -916,13 +1393,14 @@ class AplikasiManajemenMahasiswa:
             
             if st.button("📊 Download sebagai CSV", use_container_width=True):
                 try:
-                    data = self.data_manager.get_all()
-                    df = pd.DataFrame([m.to_dict() for m in data])
-                    csv = df.to_csv(index=False)
+                    buffer = io.StringIO()
+                    writer = csv.writer(buffer, lineterminator='\n')
+                    writer.writerow(['id', 'nama', 'nim'])
+                    writer.writerows((m.id, m.nama, m.nim) for m in self.data_manager.get_all())
                     
                     st.download_button(
                         label="Klik untuk download",
-                        data=csv,
+                        data=buffer.getvalue(),
                         file_name="data_mahasiswa.csv",
                         mime="text/csv"
                     )
@@ -936,24 +1414,26 @@ class AplikasiManajemenMahasiswa:
             
             if uploaded_file is not None:
                 try:
-                    data = json.load(uploaded_file)
+                    data = _json_loads(uploaded_file.read())
                     
                     # Validasi format
                     if isinstance(data, list):
-                        imported_data = [Mahasiswa.from_dict(item) for item in data]
-                        
                         if st.button("Import Data", type="primary"):
-                            # Tambahkan data baru (skip duplikat NIM)
-                            existing_nims = {m.nim for m in self.data_manager.get_all()}
-                            added_count = 0
+                            # Objek hanya dibuat saat tombol ditekan, dan hanya
+                            # untuk NIM baru (skip duplikat NIM, juga di dalam file).
+                            # ID dari file tidak dipakai; tambah_batch memberi ID baru
+                            find = self.data_manager.find_by_nim
+                            seen = set()
+                            imported_data = []
+                            for item in data:
+                                nim = item['nim']
+                                if nim not in seen and find(nim) is None:
+                                    seen.add(nim)
+                                    imported_data.append(Mahasiswa.from_dict(item))
                             
-                            for mhs in imported_data:
-                                if mhs.nim not in existing_nims:
-                                    self.data_manager.tambah(mhs)
-                                    existing_nims.add(mhs.nim)
-                                    added_count += 1
+                            self.data_manager.tambah_batch(imported_data)
+                            added_count = len(imported_data)
                             
-                            self.data_manager.simpan_ke_file()
                             st.success(f"Berhasil mengimpor {added_count} data baru!")
                             st.rerun()
                     else:
@@ -999,18 +1479,40 @@ class AplikasiManajemenMahasiswa:
                 
                 # Test sorting algorithms
                 algorithms = [
-                    ("Bubble Sort", SortAlgorithms.bubble_sort),
-                    ("Selection Sort", SortAlgorithms.selection_sort),
-                    ("Insertion Sort", SortAlgorithms.insertion_sort),
-                    ("Merge Sort", SortAlgorithms.merge_sort),
-                    ("Shell Sort", SortAlgorithms.shell_sort)
+                    ("Bubble Sort", "bubble_sort"),
+                    ("Selection Sort", "selection_sort"),
+                    ("Insertion Sort", "insertion_sort"),
+                    ("Merge Sort", "merge_sort"),
+                    ("Shell Sort", "shell_sort")
                 ]
+                workers = min(len(algorithms), os.cpu_count() or 1)
+                
+                if len(data) >= _BENCHMARK_PARALLEL_MIN and workers > 1:
+                    # Tiap algoritma di process sendiri; waktu per algoritma
+                    # tetap diukur di dalam worker masing-masing
+                    records = [m.to_dict() for m in data]
+                    jobs = [(name, func_name, records) for name, func_name in algorithms]
+                    # Worker dibuat dengan spawn, bukan fork dari server Streamlit
+                    # yang multithread (fork hanya menyalin thread pemanggil)
+                    try:
+                        with ProcessPoolExecutor(
+                            max_workers=workers,
+                            mp_context=multiprocessing.get_context("spawn")
+                        ) as executor:
+                            results = list(executor.map(_benchmark_worker(), jobs))
+                    except (BrokenProcessPool, pickle.PicklingError, ImportError, OSError) as e:
+                        # Hanya kegagalan pool (start process, pickle, worker tidak
+                        # bisa di-import); error lain dari sorting tetap diteruskan
+                        st.warning(f"Benchmark paralel gagal ({e}), dijalankan berurutan")
+                        results = []
                 
-                for name, func in algorithms:
-                    start_time = time.time()
-                    func(data, 'nama')
-                    elapsed = (time.time() - start_time) * 1000
-                    results.append((name, elapsed))
+                if not results:
+                    for name, func_name in algorithms:
+                        func = getattr(SortAlgorithms, func_name)
+                        start_time = time.perf_counter_ns()
+                        func(data, 'nama')
+                        elapsed = (time.perf_counter_ns() - start_time) / 1e6
+                        results.append((name, elapsed))
                 
                 # Display results
                 df = pd.DataFrame(results, columns=["Algorithm", "Time (ms)"])
@@ -1019,17 +1521,36 @@ class AplikasiManajemenMahasiswa:
                 # Chart
                 st.bar_chart(df.set_index("Algorithm"))
     
+    @staticmethod
+    def _kolom(data: List[Mahasiswa]) -> tuple[List[str], List[str]]:
+        """Memecah list mahasiswa menjadi kolom NIM dan kolom nama"""
+        return [m.nim for m in data], [m.nama for m in data]
+    
+    @staticmethod
+    def _buat_tabel(nims: List[str], namas: List[str]):
+        """
+        Membangun tabel Arrow No/NIM/Nama langsung dari kolom.
+        st.dataframe mengirim data ke browser dalam format Arrow, jadi
+        konversi lewat pandas (inferensi dtype, index) dilewati.
+        """
+        return pa.table({
+            "No": pa.array(range(1, len(nims) + 1), type=pa.int32()),
+            "NIM": pa.array(nims, type=pa.string()),
+            "Nama": pa.array(namas, type=pa.string())
+        })
+    
     def _display_data_table(self):
         """Menampilkan data dalam tabel"""
-        data = self.data_manager.get_all()
-        
-        df = pd.DataFrame([
-            {"No": i+1, "NIM": m.nim, "Nama": m.nama}
-            for i, m in enumerate(data)
-        ])
+        # Tabel Arrow hanya dibangun ulang bila data berubah (versi naik);
+        # rerun lain memakai tabel yang tersimpan di session_state
+        ver = self.data_manager.get_version()
+        if st.session_state.get('_last_table_ver') != ver:
+            st.session_state._cached_table = self._buat_tabel(*self.data_manager.get_columns())
+            st.session_state._last_table_ver = ver
+        tabel = st.session_state._cached_table
         
         st.dataframe(
-            df,
+            tabel,
             use_container_width=True,
             hide_index=True,
             column_config={
@@ -1077,15 +1598,11 @@ class AplikasiManajemenMahasiswa:
         
         try:
             # Clear existing data
-            for _ in range(self.data_manager.get_count()):
-                self.data_manager.hapus(0)
+            self.data_manager.clear()
             
             # Add sample data
-            for nama, nim in sample_data:
-                mhs = Mahasiswa(nama, nim)
-                self.data_manager.tambah(mhs)
+            self.data_manager.tambah_batch([Mahasiswa(nama, nim) for nama, nim in sample_data])
             
-            self.data_manager.simpan_ke_file()
             st.success("Data sample berhasil dimuat!")
             st.rerun()
         
@@ -1099,7 +1616,13 @@ class AplikasiManajemenMahasiswa:
 def main():
     """Fungsi utama untuk menjalankan aplikasi"""
     try:
-        app = AplikasiManajemenMahasiswa()
+        # Satu instance aplikasi per sesi (menyimpan status login): Streamlit
+        # menjalankan ulang skrip di setiap interaksi, jadi objek disimpan di
+        # session_state. DataManager di dalamnya dipakai bersama semua sesi
+        app = st.session_state.get('app')
+        if app is None:
+            app = AplikasiManajemenMahasiswa()
+            st.session_state.app = app
         app.run()
     
     except Exception as e: